@@ -21,10 +21,12 @@ router = APIRouter(prefix="/organizations", tags=["organizations"])
 
 security = HTTPBearer()
 
+_SLUG_INVALID_CHARS = re.compile(r'[^a-z0-9]+')
+
 def generate_slug(name: str) -> str:
     """Generate a URL-friendly slug from organization name."""
     # Convert to lowercase and replace spaces/special chars with hyphens
-    slug = re.sub(r'[^a-z0-9]+', '-', name.lower().strip())
+    slug = _SLUG_INVALID_CHARS.sub('-', name.lower().strip())
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
     # Limit length